@@ -1 +1,11 @@
-__all__ = ["server", "reader", "runner", "schemas", "errors", "security"]
+__all__ = [
+    "server",
+    "reader",
+    "runner",
+    "schemas",
+    "errors",
+    "security",
+    "cache",
+    "compression",
+    "loadgen",
+]
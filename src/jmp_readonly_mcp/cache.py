@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api import types as pd_types
+
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+CATEGORY_MAX_RATIO = 0.5
+
+
+def cache_max_bytes() -> int:
+    return max(int(os.environ.get("TABLE_CACHE_MAX_BYTES", str(DEFAULT_CACHE_MAX_BYTES))), 0)
+
+
+def _downcast_float(series: pd.Series) -> pd.Series:
+    narrowed = series.astype(np.float32)
+    same = (narrowed.astype(series.dtype) == series) | series.isna()
+    return narrowed if bool(same.all()) else series
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink column dtypes of a freshly parsed table without changing values.
+
+    Integers and floats are downcast only when lossless; columns holding only
+    strings whose distinct values are at most half the row count become
+    categoricals. Mixed object columns (e.g. bools with missing values) are
+    left alone so the reported schema type does not change.
+    """
+    rows = int(df.shape[0])
+    for name in df.columns:
+        series = df[name]
+        if pd_types.is_bool_dtype(series):
+            continue
+        if pd_types.is_integer_dtype(series):
+            df[name] = pd.to_numeric(series, downcast="integer")
+        elif pd_types.is_float_dtype(series):
+            df[name] = _downcast_float(series)
+        elif rows and (pd_types.is_string_dtype(series) or pd_types.is_object_dtype(series)):
+            if pd_types.infer_dtype(series, skipna=True) != "string":
+                continue
+            if series.nunique(dropna=True) <= rows * CATEGORY_MAX_RATIO:
+                df[name] = series.astype("category")
+    return df
+
+
+def _file_signature(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class TableCache:
+    """LRU cache of parsed tables keyed by path, mtime and size.
+
+    Entries are evicted least-recently-used first once resident bytes exceed
+    ``max_bytes``; a table larger than the whole budget is never cached.
+    With ``max_bytes <= 0`` the cache is disabled and the loader's frame is
+    returned as is. Cached DataFrames are shared between callers and must not
+    be mutated. Parsing happens outside the lock, so concurrent misses on the
+    same path each parse the file; the last one to finish is kept.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        self.max_bytes = cache_max_bytes() if max_bytes is None else max(max_bytes, 0)
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], pd.DataFrame, int]]" = (
+            OrderedDict()
+        )
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self, file_path: str, loader: Callable[[str], pd.DataFrame]
+    ) -> pd.DataFrame:
+        if self.max_bytes <= 0:
+            with self._lock:
+                self._misses += 1
+            return loader(file_path)
+
+        signature = _file_signature(file_path)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(file_path)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+            if entry is not None:
+                self._drop(file_path)
+
+        df = compact_dtypes(loader(file_path))
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return df
+
+        with self._lock:
+            if file_path in self._entries:
+                self._drop(file_path)
+            self._entries[file_path] = (signature, df, size)
+            self._resident_bytes += size
+            while self._resident_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+        return df
+
+    def _drop(self, file_path: str) -> None:
+        _, _, size = self._entries.pop(file_path)
+        self._resident_bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._resident_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "residentBytes": self._resident_bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hitRate": self._hits / lookups if lookups else 0.0,
+            }
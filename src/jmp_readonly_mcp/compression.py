@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import io
+import os
+import struct
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+try:  # optional: needed only for .csv.zst tables
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+COMPRESSED_CSV_EXTENSIONS: Dict[str, str] = {
+    ".csv.gz": "gzip",
+    ".csv.bz2": "bz2",
+    ".csv.zst": "zstd",
+}
+CSV_EXTENSIONS = (".csv", *COMPRESSED_CSV_EXTENSIONS)
+
+_GZIP_MAGIC = b"\x1f\x8b\x08"
+_GZIP_FEXTRA = 0x04
+_ZSTD_MAGIC = 0xFD2FB528
+_ZSTD_SKIPPABLE_MASK = 0xFFFFFFF0
+_ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+
+# Contiguous segments are decompressed in batches of about this many
+# compressed bytes; at most two batches per worker are held in memory, and the
+# worker count is capped so that window does not grow with the host's cores.
+_BATCH_COMPRESSED_BYTES = 4 * 1024 * 1024
+_MAX_DECOMPRESS_WORKERS = 8
+
+Segment = Tuple[int, int]
+
+
+def table_extension(path: str) -> str:
+    """Return the table extension, including compound ones such as .csv.gz."""
+    lowered = Path(path).name.lower()
+    for ext in COMPRESSED_CSV_EXTENSIONS:
+        if lowered.endswith(ext):
+            return ext
+    return Path(path).suffix.lower()
+
+
+def format_available(ext: str) -> bool:
+    """Whether the optional dependency needed to read this table format is installed."""
+    return ext != ".csv.zst" or zstandard is not None
+
+
+def table_name(path: str) -> str:
+    name = Path(path).name
+    ext = table_extension(path)
+    return name[: len(name) - len(ext)] if ext else name
+
+
+def _gzip_segments(fh: BinaryIO, file_size: int) -> Optional[List[Segment]]:
+    """Split a multi-member gzip whose members record their size (BGZF "BC").
+
+    Plain concatenated gzip members carry no length, so they can only be
+    found by decompressing; those files return None and stream sequentially.
+    """
+    segments: List[Segment] = []
+    offset = 0
+    while offset < file_size:
+        fh.seek(offset)
+        header = fh.read(12)
+        if len(header) < 12 or header[:3] != _GZIP_MAGIC or not header[3] & _GZIP_FEXTRA:
+            return None
+        (xlen,) = struct.unpack("<H", header[10:12])
+        extra = fh.read(xlen)
+        block_size = None
+        pos = 0
+        while pos + 4 <= len(extra):
+            (slen,) = struct.unpack("<H", extra[pos + 2 : pos + 4])
+            if extra[pos : pos + 2] == b"BC" and slen == 2:
+                block_size = struct.unpack("<H", extra[pos + 4 : pos + 6])[0] + 1
+                break
+            pos += 4 + slen
+        if block_size is None or offset + block_size > file_size:
+            return None
+        segments.append((offset, block_size))
+        offset += block_size
+    return segments
+
+
+def _zstd_frame_length(fh: BinaryIO, offset: int) -> Optional[Tuple[int, bool]]:
+    """Return (length, skippable) of the frame at offset by walking block headers."""
+    fh.seek(offset)
+    head = fh.read(8)
+    if len(head) < 5:
+        return None
+    (magic,) = struct.unpack("<I", head[:4])
+    if magic & _ZSTD_SKIPPABLE_MASK == _ZSTD_SKIPPABLE_MAGIC:
+        if len(head) < 8:
+            return None
+        (frame_size,) = struct.unpack("<I", head[4:8])
+        return 8 + frame_size, True
+    if magic != _ZSTD_MAGIC:
+        return None
+
+    descriptor = head[4]
+    fcs_flag = descriptor >> 6
+    single_segment = (descriptor >> 5) & 1
+    checksum = (descriptor >> 2) & 1
+    dict_id_size = (0, 1, 2, 4)[descriptor & 3]
+    fcs_size = (1 if single_segment else 0, 2, 4, 8)[fcs_flag]
+    pos = offset + 5 + (0 if single_segment else 1) + dict_id_size + fcs_size
+
+    while True:
+        fh.seek(pos)
+        block_header = fh.read(3)
+        if len(block_header) < 3:
+            return None
+        value = int.from_bytes(block_header, "little")
+        last, block_type, block_size = value & 1, (value >> 1) & 3, value >> 3
+        if block_type == 3:
+            return None
+        pos += 3 + (1 if block_type == 1 else block_size)
+        if last:
+            break
+    return pos + (4 if checksum else 0) - offset, False
+
+
+def _zstd_segments(fh: BinaryIO, file_size: int) -> Optional[List[Segment]]:
+    segments: List[Segment] = []
+    offset = 0
+    while offset < file_size:
+        frame = _zstd_frame_length(fh, offset)
+        if frame is None or offset + frame[0] > file_size:
+            return None
+        length, skippable = frame
+        if not skippable:
+            segments.append((offset, length))
+        offset += length
+    return segments
+
+
+def _gzip_decompress(data: memoryview) -> bytes:
+    return zlib.decompress(data, wbits=31)
+
+
+def _zstd_decompress(data: memoryview) -> bytes:
+    # Decompressor contexts are not thread-safe, so each segment gets its own.
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def _batch_segments(segments: List[Segment]) -> List[List[Segment]]:
+    batches: List[List[Segment]] = []
+    current: List[Segment] = []
+    size = 0
+    for segment in segments:
+        current.append(segment)
+        size += segment[1]
+        if size >= _BATCH_COMPRESSED_BYTES:
+            batches.append(current)
+            current, size = [], 0
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _iter_decompressed(
+    file_path: str, segments: List[Segment], decompress: Callable[[memoryview], bytes]
+) -> Iterator[bytes]:
+    """Yield decompressed segments in file order, decompressing batches in parallel.
+
+    Each worker thread keeps one file handle and reads a whole contiguous batch
+    at once; at most ``2 * _MAX_DECOMPRESS_WORKERS`` batches are in flight.
+    """
+    batches = _batch_segments(segments)
+    workers = min(len(batches), os.cpu_count() or 1, _MAX_DECOMPRESS_WORKERS)
+    local = threading.local()
+    handles: List[BinaryIO] = []
+    handles_lock = threading.Lock()
+
+    def work(batch: List[Segment]) -> List[bytes]:
+        fh = getattr(local, "fh", None)
+        if fh is None:
+            fh = open(file_path, "rb")
+            local.fh = fh
+            with handles_lock:
+                handles.append(fh)
+        base = batch[0][0]
+        fh.seek(base)
+        raw = memoryview(fh.read(batch[-1][0] + batch[-1][1] - base))
+        return [decompress(raw[offset - base : offset - base + length]) for offset, length in batch]
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    pending: Deque[Future] = deque()
+    remaining = iter(batches)
+    try:
+        for batch in remaining:
+            pending.append(pool.submit(work, batch))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            chunks = pending.popleft().result()
+            batch = next(remaining, None)
+            if batch is not None:
+                pending.append(pool.submit(work, batch))
+            # Hand chunks out one at a time so each is released once consumed.
+            chunks.reverse()
+            while chunks:
+                yield chunks.pop()
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+        for fh in handles:
+            fh.close()
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only binary stream over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _splittable_segments(
+    file_path: str, compression: str
+) -> Tuple[Optional[List[Segment]], Optional[Callable[[memoryview], bytes]]]:
+    if compression == "gzip":
+        finder, decompress = _gzip_segments, _gzip_decompress
+    elif compression == "zstd" and zstandard is not None:
+        finder, decompress = _zstd_segments, _zstd_decompress
+    else:
+        return None, None
+    with open(file_path, "rb") as fh:
+        segments = finder(fh, os.fstat(fh.fileno()).st_size)
+    if not segments or len(segments) < 2:
+        return None, None
+    return segments, decompress
+
+
+def read_csv_table(file_path: str, nrows: Optional[int] = None) -> pd.DataFrame:
+    """Read a plain or compressed CSV table.
+
+    With ``nrows`` the file is decompressed as a stream and parsing stops after
+    the leading rows. Full reads of gzip (BGZF) members or zstd frames are
+    decompressed in parallel and streamed to pandas in file order; everything
+    else streams through pandas directly.
+    """
+    compression = COMPRESSED_CSV_EXTENSIONS.get(table_extension(file_path))
+    if compression is None:
+        return pd.read_csv(file_path, nrows=nrows)
+    if nrows is None:
+        segments, decompress = _splittable_segments(file_path, compression)
+        if segments is not None and decompress is not None:
+            chunks = _iter_decompressed(file_path, segments, decompress)
+            try:
+                return pd.read_csv(io.BufferedReader(_ChunkReader(chunks)))
+            finally:
+                chunks.close()
+    return pd.read_csv(file_path, nrows=nrows, compression=compression)
@@ -0,0 +1,452 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shlex
+import shutil
+import stat
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+DEFAULT_MIX: Dict[str, float] = {
+    "tables_list": 1.0,
+    "table_schema": 2.0,
+    "table_preview": 3.0,
+}
+
+# Stand-in for jmp.exe: reads input.json next to the job script and writes
+# a synthetic output.json, so .jmp tables can be exercised without JMP.
+_FAKE_JMP_SOURCE = '''\
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+run_dir = Path(sys.argv[1]).parent
+payload = json.loads((run_dir / "input.json").read_text(encoding="utf-8"))
+params = payload.get("params") or {}
+delay = float(os.environ.get("FAKE_JMP_DELAY_SEC", "0") or 0)
+if delay > 0:
+    time.sleep(delay)
+
+rows = int(os.environ.get("FAKE_JMP_ROWS", "1000"))
+names = ["id", "value", "label"]
+if payload["action"] == "schema":
+    output = {
+        "rows": rows,
+        "cols": len(names),
+        "columns": [
+            {"name": "id", "type": "numeric", "missingRate": 0.0, "nUnique": None},
+            {"name": "value", "type": "numeric", "missingRate": 0.0, "nUnique": None},
+            {"name": "label", "type": "character", "missingRate": 0.0, "nUnique": None},
+        ],
+        "limits": {"nUniqueMayBeNull": True},
+    }
+else:
+    requested = int(params.get("rows", 0))
+    take = min(requested, rows)
+    rng = random.Random(int(params.get("seed", 0)))
+    if params.get("method") == "head":
+        idx = list(range(take))
+    else:
+        idx = sorted(rng.sample(range(rows), take))
+    output = {
+        "rowsRequested": requested,
+        "rowsReturned": take,
+        "data": [{"id": i, "value": i * 0.5, "label": "L%d" % (i % 7)} for i in idx],
+        "truncated": requested > rows,
+    }
+(run_dir / "output.json").write_text(json.dumps(output), encoding="utf-8")
+'''
+
+
+@dataclass
+class LoadConfig:
+    clients: int = 4
+    requests_per_client: int = 50
+    concurrency: int = 1
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    csv_tables: int = 4
+    jmp_tables: int = 1
+    table_rows: int = 10_000
+    table_cols: int = 8
+    preview_rows: int = 200
+    jmp_delay_sec: float = 0.0
+    seed: int = 42
+    server_command: Optional[List[str]] = None
+    timeout_sec: float = 30.0
+
+
+@dataclass
+class CallSample:
+    tool: str
+    latency_sec: Optional[float]
+    error: Optional[str] = None
+
+
+class _StartGate:
+    """Release all clients at once, after every session has initialized or failed."""
+
+    def __init__(self, parties: int) -> None:
+        self._remaining = parties
+        self._event = asyncio.Event()
+        self.started_at: Optional[float] = None
+
+    def arrive(self) -> None:
+        self._remaining -= 1
+        if self._remaining <= 0 and not self._event.is_set():
+            self.started_at = time.perf_counter()
+            self._event.set()
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
+
+def _server_command() -> List[str]:
+    exe = shutil.which("jmp-readonly-mcp")
+    if exe:
+        return [exe]
+    return [sys.executable, "-m", "jmp_readonly_mcp.server"]
+
+
+def _write_fake_jmp(work_dir: Path) -> str:
+    script_path = work_dir / "fake_jmp.py"
+    script_path.write_text(_FAKE_JMP_SOURCE, encoding="utf-8")
+    if os.name == "nt":
+        launcher = work_dir / "fake_jmp.cmd"
+        launcher.write_text(f'@"{sys.executable}" "{script_path}" %*\r\n', encoding="utf-8")
+    else:
+        launcher = work_dir / "fake_jmp"
+        launcher.write_text(
+            f'#!/bin/sh\nexec "{sys.executable}" "{script_path}" "$@"\n', encoding="utf-8"
+        )
+        launcher.chmod(launcher.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return str(launcher)
+
+
+def write_synthetic_tables(data_dir: Path, config: LoadConfig) -> List[str]:
+    """Write CSV tables and placeholder .jmp files; return their tableIds."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(config.seed)
+    labels = ["alpha", "beta", "gamma", "delta", "epsilon"]
+    table_ids: List[str] = []
+
+    header = ",".join(f"c{j}" for j in range(config.table_cols))
+    for i in range(config.csv_tables):
+        path = data_dir / f"synthetic_{i}.csv"
+        lines = [header]
+        for r in range(config.table_rows):
+            cells: List[str] = []
+            for j in range(config.table_cols):
+                if j % 3 == 0:
+                    cells.append(str(r))
+                elif j % 3 == 1:
+                    cells.append("" if rng.random() < 0.05 else f"{rng.random() * 100:.4f}")
+                else:
+                    cells.append(rng.choice(labels))
+            lines.append(",".join(cells))
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        table_ids.append(f"file:{os.path.realpath(path)}")
+
+    for i in range(config.jmp_tables):
+        # The fake JMP never opens the file; it only needs to exist.
+        path = data_dir / f"synthetic_{i}.jmp"
+        path.write_bytes(b"")
+        table_ids.append(f"file:{os.path.realpath(path)}")
+
+    return table_ids
+
+
+def _call_error(result: Any) -> Optional[str]:
+    if getattr(result, "isError", False):
+        return "TOOL_ERROR"
+    if not result.content:
+        return "EMPTY_RESPONSE"
+    try:
+        envelope = json.loads(result.content[0].text)
+        if isinstance(envelope, dict) and "content" in envelope:
+            if envelope.get("isError"):
+                inner = json.loads(envelope["content"][0]["text"])
+                return inner.get("error", {}).get("code", "TOOL_ERROR")
+            json.loads(envelope["content"][0]["text"])
+    except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+        return "BAD_RESPONSE"
+    return None
+
+
+def _pick_call(
+    rng: random.Random, config: LoadConfig, data_dir: str, table_ids: List[str]
+) -> Tuple[str, Dict[str, Any]]:
+    tools = list(config.mix)
+    tool = rng.choices(tools, weights=[config.mix[t] for t in tools])[0]
+    if tool == "tables_list":
+        return tool, {"path": data_dir}
+    table_id = rng.choice(table_ids)
+    if tool == "table_schema":
+        return tool, {"tableId": table_id}
+    return tool, {
+        "tableId": table_id,
+        "rows": config.preview_rows,
+        "method": rng.choice(["head", "random"]),
+        "seed": rng.randrange(0, 2**31 - 1),
+    }
+
+
+async def _run_client(
+    client_index: int,
+    params: StdioServerParameters,
+    config: LoadConfig,
+    data_dir: str,
+    table_ids: List[str],
+    samples: List[CallSample],
+    gate: _StartGate,
+    finished_at: List[float],
+) -> bool:
+    """Run one session; return False if the session itself failed."""
+    rng = random.Random(config.seed + client_index)
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(config.requests_per_client):
+        queue.put_nowait(_pick_call(rng, config, data_dir, table_ids))
+
+    arrived = False
+    failure = "SESSION_FAILED"
+    try:
+        with open(os.devnull, "w", encoding="utf-8") as errlog:
+            async with stdio_client(params, errlog=errlog) as (read, write):
+                async with ClientSession(read, write) as session:
+                    try:
+                        await asyncio.wait_for(session.initialize(), config.timeout_sec)
+                    except asyncio.TimeoutError:
+                        failure = "TIMEOUT"
+                        raise
+                    gate.arrive()
+                    arrived = True
+                    await gate.wait()
+
+                    async def worker() -> None:
+                        while not queue.empty():
+                            tool, arguments = queue.get_nowait()
+                            start = time.perf_counter()
+                            try:
+                                result = await asyncio.wait_for(
+                                    session.call_tool(tool, arguments), config.timeout_sec
+                                )
+                                error = _call_error(result)
+                            except asyncio.TimeoutError:
+                                error = "TIMEOUT"
+                            except Exception as exc:  # transport failure, server crash
+                                error = type(exc).__name__
+                            samples.append(
+                                CallSample(tool, time.perf_counter() - start, error)
+                            )
+
+                    await asyncio.gather(
+                        *(worker() for _ in range(max(config.concurrency, 1)))
+                    )
+                    finished_at.append(time.perf_counter())
+    except Exception:  # server failed to start, initialize or transport broke
+        if not arrived:
+            gate.arrive()
+        while not queue.empty():
+            tool, _ = queue.get_nowait()
+            samples.append(CallSample(tool, None, failure))
+        return False
+    return True
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; returns 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _summarize(samples: List[CallSample], wall_sec: float) -> Dict[str, Any]:
+    def stats(group: List[CallSample]) -> Dict[str, Any]:
+        latencies_ms = [s.latency_sec * 1000.0 for s in group if s.latency_sec is not None]
+        errors: Dict[str, int] = {}
+        for s in group:
+            if s.error:
+                errors[s.error] = errors.get(s.error, 0) + 1
+        n_errors = sum(errors.values())
+        return {
+            "requests": len(group),
+            "errors": n_errors,
+            "errorRate": n_errors / len(group) if group else 0.0,
+            "errorCodes": errors,
+            "p50Ms": round(percentile(latencies_ms, 50), 3),
+            "p99Ms": round(percentile(latencies_ms, 99), 3),
+            "meanMs": round(sum(latencies_ms) / len(latencies_ms), 3) if latencies_ms else 0.0,
+        }
+
+    by_tool: Dict[str, List[CallSample]] = {}
+    for s in samples:
+        by_tool.setdefault(s.tool, []).append(s)
+    completed = sum(1 for s in samples if s.latency_sec is not None)
+
+    return {
+        "wallSec": round(wall_sec, 3),
+        "throughputRps": round(completed / wall_sec, 3) if wall_sec > 0 else 0.0,
+        **stats(samples),
+        "tools": {tool: stats(group) for tool, group in sorted(by_tool.items())},
+    }
+
+
+async def run_load(config: LoadConfig, work_dir: Path) -> Dict[str, Any]:
+    data_dir = work_dir / "data"
+    table_ids = write_synthetic_tables(data_dir, config)
+    env = dict(os.environ)
+    env.update(
+        {
+            "DATA_ROOTS": os.path.realpath(data_dir),
+            "JMP_EXE_PATH": _write_fake_jmp(work_dir),
+            "TEMP_ROOT": str(work_dir / "runs"),
+            "FAKE_JMP_DELAY_SEC": str(config.jmp_delay_sec),
+            "FAKE_JMP_ROWS": str(config.table_rows),
+        }
+    )
+    command = config.server_command or _server_command()
+    params = StdioServerParameters(command=command[0], args=command[1:], env=env)
+
+    samples: List[CallSample] = []
+    gate = _StartGate(config.clients)
+    finished_at: List[float] = []
+    launched = time.perf_counter()
+    succeeded = await asyncio.gather(
+        *(
+            _run_client(
+                i,
+                params,
+                config,
+                os.path.realpath(data_dir),
+                table_ids,
+                samples,
+                gate,
+                finished_at,
+            )
+            for i in range(config.clients)
+        )
+    )
+
+    # Only the tool-call phase is timed: from the moment every session has
+    # initialized until the last worker drains its queue.
+    started_at = gate.started_at if gate.started_at is not None else launched
+    wall_sec = max(finished_at) - started_at if finished_at else 0.0
+
+    report = _summarize(samples, wall_sec)
+    report["startupSec"] = round(started_at - launched, 3)
+    report["failedSessions"] = sum(1 for ok in succeeded if not ok)
+    report["config"] = {
+        "clients": config.clients,
+        "requestsPerClient": config.requests_per_client,
+        "concurrency": config.concurrency,
+        "mix": config.mix,
+        "csvTables": config.csv_tables,
+        "jmpTables": config.jmp_tables,
+        "tableRows": config.table_rows,
+        "tableCols": config.table_cols,
+        "previewRows": config.preview_rows,
+        "timeoutSec": config.timeout_sec,
+    }
+    return report
+
+
+def _parse_mix(value: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for token in value.split(","):
+        token = token.strip()
+        if not token:
+            continue
+        name, _, weight = token.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown tool in mix: {name}")
+        mix[name] = float(weight) if weight else 1.0
+        if mix[name] < 0:
+            raise argparse.ArgumentTypeError(f"mix weight must not be negative: {token}")
+    if not mix or sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("mix must contain at least one positive weight")
+    return mix
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="jmp-readonly-mcp-loadgen",
+        description="Drive jmp-readonly-mcp over stdio with concurrent client sessions.",
+    )
+    parser.add_argument("--clients", type=int, default=4, help="concurrent client sessions")
+    parser.add_argument("--requests", type=int, default=50, help="tool calls per client")
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="in-flight calls per client session"
+    )
+    parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default=dict(DEFAULT_MIX),
+        help="tool weights, e.g. tables_list=1,table_schema=2,table_preview=3",
+    )
+    parser.add_argument("--csv-tables", type=int, default=4)
+    parser.add_argument("--jmp-tables", type=int, default=1)
+    parser.add_argument("--table-rows", type=int, default=10_000)
+    parser.add_argument("--table-cols", type=int, default=8)
+    parser.add_argument("--preview-rows", type=int, default=200)
+    parser.add_argument(
+        "--jmp-delay", type=float, default=0.0, help="seconds the fake JMP sleeps per run"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="seconds allowed for session initialize and for each tool call",
+    )
+    parser.add_argument("--work-dir", help="keep synthetic data and run artifacts here")
+    parser.add_argument(
+        "--server-command", help="command line used to start the server (default: jmp-readonly-mcp)"
+    )
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        clients=args.clients,
+        requests_per_client=args.requests,
+        concurrency=args.concurrency,
+        mix=args.mix,
+        csv_tables=args.csv_tables,
+        jmp_tables=args.jmp_tables,
+        table_rows=args.table_rows,
+        table_cols=args.table_cols,
+        preview_rows=args.preview_rows,
+        jmp_delay_sec=args.jmp_delay,
+        seed=args.seed,
+        timeout_sec=args.timeout,
+        server_command=shlex.split(args.server_command) if args.server_command else None,
+    )
+
+    if args.work_dir:
+        work_dir = Path(args.work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        report = asyncio.run(run_load(config, work_dir))
+    else:
+        with tempfile.TemporaryDirectory(prefix="jmp_mcp_load_") as tmp:
+            report = asyncio.run(run_load(config, Path(tmp)))
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
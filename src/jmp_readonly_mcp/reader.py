@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import json
 import os
-from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 from pandas.api import types as pd_types
 
+from .cache import TableCache
+from .compression import (
+    CSV_EXTENSIONS,
+    format_available,
+    read_csv_table,
+    table_extension,
+    table_name,
+)
 from .errors import MCPError, ErrorCode
 from .runner import run_jmp
 from .security import data_roots, ensure_allowed_path
@@ -15,6 +22,8 @@ from .security import data_roots, ensure_allowed_path
 NUNIQUE_ROW_THRESHOLD = 200_000
 NUNIQUE_COL_THRESHOLD = 2_000
 
+_TABLE_CACHE: TableCache | None = None
+
 
 def parse_table_id(table_id: str) -> str:
     if not table_id.startswith("file:"):
@@ -30,7 +39,20 @@ def _normalize_path(path: str) -> str:
     return ensure_allowed_path(path, roots)
 
 
+def _table_cache() -> TableCache:
+    global _TABLE_CACHE
+    if _TABLE_CACHE is None:
+        _TABLE_CACHE = TableCache()
+    return _TABLE_CACHE
+
+
+def table_cache_stats() -> Dict[str, Any]:
+    return _table_cache().stats()
+
+
 def _map_dtype(series: pd.Series) -> str:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return _map_dtype(pd.Series(series.cat.categories))
     if pd_types.is_bool_dtype(series):
         return "boolean"
     if pd_types.is_numeric_dtype(series):
@@ -42,15 +64,32 @@ def _map_dtype(series: pd.Series) -> str:
     return "unknown"
 
 
-def _csv_schema(file_path: str, max_columns: int) -> Dict[str, Any]:
+def _load_csv(file_path: str, purpose: str, head_rows: int | None = None) -> pd.DataFrame:
     try:
-        df = pd.read_csv(file_path)
+        if head_rows is not None:
+            # Head previews always parse (and decompress) only the leading rows,
+            # cached or not, so their dtypes are inferred from those rows alone.
+            return read_csv_table(file_path, nrows=head_rows)
+        return _table_cache().get_or_load(file_path, read_csv_table)
     except Exception as exc:  # pragma: no cover - depends on pandas internals
         raise MCPError(
             ErrorCode.READ_FAILED,
-            "Failed to read CSV for schema",
+            f"Failed to read CSV for {purpose}",
             {"path": file_path, "hint": str(exc)},
         ) from exc
+
+
+def _ensure_format_available(file_path: str, ext: str) -> None:
+    if not format_available(ext):
+        raise MCPError(
+            ErrorCode.INVALID_ARGUMENT,
+            "zstandard is not installed; .csv.zst tables are unavailable",
+            {"path": file_path, "hint": "pip install jmp-readonly-mcp[zstd]"},
+        )
+
+
+def _csv_schema(file_path: str, max_columns: int) -> Dict[str, Any]:
+    df = _load_csv(file_path, "schema")
     rows = int(df.shape[0])
     cols = int(df.shape[1])
 
@@ -80,14 +119,7 @@ def _csv_schema(file_path: str, max_columns: int) -> Dict[str, Any]:
 
 
 def _csv_preview(file_path: str, rows: int, method: str, seed: int) -> Dict[str, Any]:
-    try:
-        df = pd.read_csv(file_path)
-    except Exception as exc:  # pragma: no cover - depends on pandas internals
-        raise MCPError(
-            ErrorCode.READ_FAILED,
-            "Failed to read CSV for preview",
-            {"path": file_path, "hint": str(exc)},
-        ) from exc
+    df = _load_csv(file_path, "preview", rows if method == "head" else None)
     total_rows = int(df.shape[0])
     rows_take = min(rows, total_rows)
 
@@ -117,10 +149,11 @@ def table_schema(table_id: str, max_columns: int) -> Dict[str, Any]:
     if not os.path.exists(file_path):
         raise MCPError(ErrorCode.NOT_FOUND, "File not found", {"path": file_path})
 
-    ext = Path(file_path).suffix.lower()
-    name = Path(file_path).stem
+    ext = table_extension(file_path)
+    name = table_name(file_path)
 
-    if ext == ".csv":
+    if ext in CSV_EXTENSIONS:
+        _ensure_format_available(file_path, ext)
         output = _csv_schema(file_path, max_columns)
     elif ext == ".jmp":
         output = run_jmp("schema", file_path, {"maxColumns": max_columns})
@@ -143,10 +176,11 @@ def table_preview(table_id: str, rows: int, method: str, seed: int) -> Dict[str,
     if not os.path.exists(file_path):
         raise MCPError(ErrorCode.NOT_FOUND, "File not found", {"path": file_path})
 
-    ext = Path(file_path).suffix.lower()
-    name = Path(file_path).stem
+    ext = table_extension(file_path)
+    name = table_name(file_path)
 
-    if ext == ".csv":
+    if ext in CSV_EXTENSIONS:
+        _ensure_format_available(file_path, ext)
         output = _csv_preview(file_path, rows, method, seed)
     elif ext == ".jmp":
         output = run_jmp("preview", file_path, {"rows": rows, "method": method, "seed": seed})
@@ -185,13 +219,13 @@ def tables_list(path: str, extensions: List[str]) -> Dict[str, Any]:
         full_path = os.path.join(dir_path, entry)
         if not os.path.isfile(full_path):
             continue
-        ext = Path(full_path).suffix.lower()
-        if ext not in normalized_exts:
+        ext = table_extension(full_path)
+        if ext not in normalized_exts or not format_available(ext):
             continue
         tables.append(
             {
                 "tableId": f"file:{os.path.abspath(full_path)}",
-                "name": Path(full_path).stem,
+                "name": table_name(full_path),
                 "format": ext.lstrip("."),
                 "path": os.path.abspath(full_path),
                 "sizeBytes": os.path.getsize(full_path),
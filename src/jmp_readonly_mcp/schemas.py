@@ -12,8 +12,11 @@ TABLES_LIST_SCHEMA: Dict[str, Any] = {
         "path": {"type": "string", "minLength": 1},
         "extensions": {
             "type": "array",
-            "items": {"type": "string", "enum": [".csv", ".jmp"]},
-            "default": [".csv", ".jmp"],
+            "items": {
+                "type": "string",
+                "enum": [".csv", ".csv.gz", ".csv.bz2", ".csv.zst", ".jmp"],
+            },
+            "default": [".csv", ".csv.gz", ".csv.bz2", ".csv.zst", ".jmp"],
         },
     },
     "required": ["path"],
@@ -0,0 +1,172 @@
+import bz2
+import gzip
+import struct
+import zlib
+
+import pytest
+
+from jmp_readonly_mcp import compression, reader
+from jmp_readonly_mcp.cache import TableCache
+from jmp_readonly_mcp.errors import ErrorCode, MCPError
+from jmp_readonly_mcp.reader import table_preview, table_schema, tables_list
+
+HEADER = "id,value,label\n"
+
+
+def _rows(start, stop):
+    return "".join(f"{i},{i * 0.25},L{i % 3}\n" for i in range(start, stop))
+
+
+def _bgzf_member(data):
+    deflate = zlib.compressobj(6, zlib.DEFLATED, -15)
+    body = deflate.compress(data) + deflate.flush()
+    extra = b"BC" + struct.pack("<HH", 2, 12 + 6 + len(body) + 8 - 1)
+    header = b"\x1f\x8b\x08\x04" + b"\x00" * 4 + b"\x00\xff" + struct.pack("<H", len(extra))
+    return header + extra + body + struct.pack("<II", zlib.crc32(data), len(data))
+
+
+def _assert_matches_plain(tmp_path, names):
+    plain_schema = table_schema(f"file:{tmp_path / 'plain.csv'}", 2000)
+    plain_random = table_preview(f"file:{tmp_path / 'plain.csv'}", 5, "random", 3)
+    for name in names:
+        schema = table_schema(f"file:{tmp_path / name}", 2000)
+        assert schema["columns"] == plain_schema["columns"]
+        assert schema["name"] == name.split(".")[0]
+        preview = table_preview(f"file:{tmp_path / name}", 5, "random", 3)
+        assert preview["data"] == plain_random["data"]
+
+
+def test_compressed_formats_match_plain_csv(tmp_path, monkeypatch):
+    text = HEADER + _rows(0, 30)
+    (tmp_path / "plain.csv").write_text(text, encoding="utf-8")
+    (tmp_path / "gz.csv.gz").write_bytes(gzip.compress(text.encode()))
+    (tmp_path / "bz.csv.bz2").write_bytes(bz2.compress(text.encode()))
+    monkeypatch.setenv("DATA_ROOTS", str(tmp_path))
+
+    listed = tables_list(str(tmp_path), [".csv", ".csv.gz", ".csv.bz2"])
+    formats = {t["name"]: t["format"] for t in listed["tables"]}
+    assert formats == {"plain": "csv", "gz": "csv.gz", "bz": "csv.bz2"}
+
+    _assert_matches_plain(tmp_path, ["gz.csv.gz", "bz.csv.bz2"])
+
+
+def test_zstd_matches_plain_csv(tmp_path, monkeypatch):
+    zstandard = pytest.importorskip("zstandard")
+    text = HEADER + _rows(0, 30)
+    (tmp_path / "plain.csv").write_text(text, encoding="utf-8")
+    (tmp_path / "zs.csv.zst").write_bytes(zstandard.ZstdCompressor().compress(text.encode()))
+    monkeypatch.setenv("DATA_ROOTS", str(tmp_path))
+
+    listed = tables_list(str(tmp_path), [".csv.zst"])
+    assert [t["format"] for t in listed["tables"]] == ["csv.zst"]
+
+    _assert_matches_plain(tmp_path, ["zs.csv.zst"])
+
+
+def test_head_preview_streams_leading_rows(tmp_path, monkeypatch):
+    path = tmp_path / "big.csv.gz"
+    path.write_bytes(gzip.compress((HEADER + _rows(0, 500)).encode()))
+    monkeypatch.setenv("DATA_ROOTS", str(tmp_path))
+    monkeypatch.setattr(reader, "_TABLE_CACHE", TableCache(max_bytes=1 << 20))
+
+    preview = table_preview(f"file:{path}", 10, "head", 42)
+    assert [row["id"] for row in preview["data"]] == list(range(10))
+    assert preview["truncated"] is False
+
+    stats = reader.table_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (0, 0, 0)
+
+    short = tmp_path / "short.csv.gz"
+    short.write_bytes(gzip.compress((HEADER + _rows(0, 3)).encode()))
+    preview = table_preview(f"file:{short}", 10, "head", 42)
+    assert preview["rowsReturned"] == 3
+    assert preview["truncated"] is True
+
+
+def _chunks():
+    return [(HEADER + _rows(0, 100)).encode(), _rows(100, 200).encode(), _rows(200, 300).encode()]
+
+
+def test_parallel_decompression_of_bgzf_members(tmp_path):
+    chunks = _chunks()
+    bgzf = tmp_path / "blocks.csv.gz"
+    bgzf.write_bytes(b"".join(_bgzf_member(c) for c in chunks) + _bgzf_member(b""))
+    segments, _ = compression._splittable_segments(str(bgzf), "gzip")
+    assert segments is not None and len(segments) == 4
+    assert list(compression.read_csv_table(str(bgzf))["id"]) == list(range(300))
+
+    plain_gzip = tmp_path / "plain.csv.gz"
+    plain_gzip.write_bytes(b"".join(gzip.compress(c) for c in chunks))
+    assert compression._splittable_segments(str(plain_gzip), "gzip") == (None, None)
+    assert len(compression.read_csv_table(str(plain_gzip))) == 300
+
+
+def test_parallel_decompression_of_zstd_frames(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    cctx = zstandard.ZstdCompressor(write_checksum=True)
+    frames = tmp_path / "frames.csv.zst"
+    frames.write_bytes(b"".join(cctx.compress(c) for c in _chunks()))
+    segments, _ = compression._splittable_segments(str(frames), "zstd")
+    assert segments is not None and len(segments) == 3
+    assert list(compression.read_csv_table(str(frames))["id"]) == list(range(300))
+
+
+def test_parallel_decompression_streams_batches_with_one_handle_per_worker(
+    tmp_path, monkeypatch
+):
+    chunks = [(HEADER + _rows(0, 50)).encode()] + [
+        _rows(i, i + 50).encode() for i in range(50, 1000, 50)
+    ]
+    path = tmp_path / "many.csv.gz"
+    path.write_bytes(b"".join(_bgzf_member(c) for c in chunks))
+    monkeypatch.setattr(compression, "_BATCH_COMPRESSED_BYTES", 1)
+
+    opened = []
+    real_open = open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    segments, decompress = compression._splittable_segments(str(path), "gzip")
+    monkeypatch.setattr(compression, "open", counting_open, raising=False)
+    stream = compression._iter_decompressed(str(path), segments, decompress)
+    assert b"".join(stream) == b"".join(chunks)
+    assert len(opened) <= compression._MAX_DECOMPRESS_WORKERS
+
+    df = compression.read_csv_table(str(path))
+    assert list(df["id"]) == list(range(1000))
+
+
+def test_head_preview_does_not_depend_on_cache_state(tmp_path, monkeypatch):
+    lines = ["a,b"] + [f"{'' if i == 60 else i},x{i}" for i in range(100)]
+    text = "\n".join(lines) + "\n"
+    plain = tmp_path / "late.csv"
+    plain.write_text(text, encoding="utf-8")
+    packed = tmp_path / "late_gz.csv.gz"
+    packed.write_bytes(gzip.compress(text.encode()))
+    monkeypatch.setenv("DATA_ROOTS", str(tmp_path))
+    monkeypatch.setattr(reader, "_TABLE_CACHE", TableCache(max_bytes=1 << 20))
+
+    for path in (plain, packed):
+        before = table_preview(f"file:{path}", 3, "head", 42)["data"]
+        table_schema(f"file:{path}", 2000)
+        after = table_preview(f"file:{path}", 3, "head", 42)["data"]
+        assert before == after
+        assert before[0] == {"a": 0, "b": "x0"}
+        assert isinstance(before[0]["a"], int)
+
+
+def test_zstd_tables_hidden_and_rejected_without_zstandard(tmp_path, monkeypatch):
+    (tmp_path / "zs.csv.zst").write_bytes(b"\x28\xb5\x2f\xfd")
+    (tmp_path / "gz.csv.gz").write_bytes(gzip.compress((HEADER + _rows(0, 3)).encode()))
+    monkeypatch.setenv("DATA_ROOTS", str(tmp_path))
+    monkeypatch.setattr(compression, "zstandard", None)
+
+    listed = tables_list(str(tmp_path), [".csv.gz", ".csv.zst"])
+    assert [t["format"] for t in listed["tables"]] == ["csv.gz"]
+
+    with pytest.raises(MCPError) as exc:
+        table_schema(f"file:{tmp_path / 'zs.csv.zst'}", 2000)
+    assert exc.value.code == ErrorCode.INVALID_ARGUMENT
+    assert "zstandard" in exc.value.message
@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import sys
+
+import pytest
+
+from jmp_readonly_mcp.loadgen import LoadConfig, _parse_mix, percentile, run_load
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 99) == 0.0
+
+
+def test_run_load_over_stdio(tmp_path):
+    config = LoadConfig(
+        clients=2,
+        requests_per_client=6,
+        concurrency=2,
+        csv_tables=1,
+        jmp_tables=1,
+        table_rows=50,
+        table_cols=3,
+        preview_rows=10,
+    )
+    report = asyncio.run(run_load(config, tmp_path))
+    assert report["requests"] == 12
+    assert report["errors"] == 0
+    assert report["throughputRps"] > 0
+    assert report["failedSessions"] == 0
+    assert report["startupSec"] > 0
+    assert set(report["tools"]) <= {"tables_list", "table_schema", "table_preview"}
+
+
+def test_run_load_reports_failed_sessions(tmp_path):
+    config = LoadConfig(
+        clients=2,
+        requests_per_client=3,
+        csv_tables=1,
+        jmp_tables=0,
+        table_rows=5,
+        table_cols=2,
+        server_command=[str(tmp_path / "missing server"), "--stdio"],
+    )
+    report = asyncio.run(run_load(config, tmp_path))
+    assert report["failedSessions"] == 2
+    assert report["requests"] == 6
+    assert report["errors"] == 6
+    assert report["errorCodes"] == {"SESSION_FAILED": 6}
+    assert report["throughputRps"] == 0.0
+
+
+def test_run_load_times_out_hung_server(tmp_path):
+    config = LoadConfig(
+        clients=2,
+        requests_per_client=2,
+        csv_tables=1,
+        jmp_tables=0,
+        table_rows=5,
+        table_cols=2,
+        server_command=[sys.executable, "-c", "import time; time.sleep(1000)"],
+        timeout_sec=1.0,
+    )
+    report = asyncio.run(asyncio.wait_for(run_load(config, tmp_path), 20))
+    assert report["failedSessions"] == 2
+    assert report["errorCodes"] == {"TIMEOUT": 4}
+
+
+def test_parse_mix_rejects_negative_weights():
+    assert _parse_mix("table_schema=0,table_preview=3") == {
+        "table_schema": 0.0,
+        "table_preview": 3.0,
+    }
+    with pytest.raises(argparse.ArgumentTypeError):
+        _parse_mix("table_schema=-1,table_preview=3")
@@ -11,7 +11,7 @@ from jmp_readonly_mcp.errors import MCPError, ErrorCode
 
 def test_tables_list_defaults():
     payload = validate_payload(TABLES_LIST_SCHEMA, {"path": "/tmp"})
-    assert payload["extensions"] == [".csv", ".jmp"]
+    assert payload["extensions"] == [".csv", ".csv.gz", ".csv.bz2", ".csv.zst", ".jmp"]
 
 
 def test_table_schema_defaults():
@@ -0,0 +1,100 @@
+import os
+
+import pandas as pd
+
+from jmp_readonly_mcp import reader
+from jmp_readonly_mcp.cache import TableCache, compact_dtypes
+
+
+def _write_csv(path, rows):
+    lines = ["id,value,label,ratio"]
+    for i in range(rows):
+        lines.append(f"{i},{i * 0.5},{'ab'[i % 2]},{i / 3}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_compact_dtypes_preserves_values(tmp_path):
+    csv_path = tmp_path / "demo.csv"
+    _write_csv(csv_path, 20)
+    raw = pd.read_csv(csv_path)
+    compact = compact_dtypes(pd.read_csv(csv_path))
+
+    assert compact["id"].dtype.itemsize < raw["id"].dtype.itemsize
+    assert compact["value"].dtype == "float32"
+    assert compact["ratio"].dtype == "float64"
+    assert isinstance(compact["label"].dtype, pd.CategoricalDtype)
+    assert compact.to_json(orient="records") == raw.to_json(orient="records")
+
+
+def test_schema_then_preview_hits_cache(tmp_path, monkeypatch):
+    csv_path = tmp_path / "demo.csv"
+    _write_csv(csv_path, 50)
+    monkeypatch.setenv("DATA_ROOTS", str(tmp_path))
+    monkeypatch.setattr(reader, "_TABLE_CACHE", TableCache(max_bytes=1 << 20))
+
+    schema = reader.table_schema(f"file:{csv_path}", 2000)
+    assert [c["type"] for c in schema["columns"]] == [
+        "numeric",
+        "numeric",
+        "character",
+        "numeric",
+    ]
+    reader.table_preview(f"file:{csv_path}", 5, "random", 42)
+    reader.table_preview(f"file:{csv_path}", 5, "random", 7)
+
+    stats = reader.table_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["entries"] == 1
+    assert stats["residentBytes"] > 0
+
+
+def test_cache_invalidates_on_change_and_evicts_lru(tmp_path):
+    paths = [tmp_path / f"t{i}.csv" for i in range(3)]
+    for path in paths:
+        _write_csv(path, 100)
+    size = int(compact_dtypes(pd.read_csv(paths[0])).memory_usage(deep=True).sum())
+    cache = TableCache(max_bytes=size * 2)
+
+    for path in paths:
+        cache.get_or_load(str(path), pd.read_csv)
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["residentBytes"] <= size * 2
+
+    _write_csv(paths[2], 10)
+    os.utime(paths[2], ns=(1, 1))
+    df = cache.get_or_load(str(paths[2]), pd.read_csv)
+    assert len(df) == 10
+    assert cache.stats()["hits"] == 0
+
+
+def test_schema_unchanged_by_cache_for_bool_with_missing(tmp_path, monkeypatch):
+    csv_path = tmp_path / "flags.csv"
+    csv_path.write_text("flag,name\nTrue,a\nFalse,a\n,b\nTrue,a\n", encoding="utf-8")
+    monkeypatch.setenv("DATA_ROOTS", str(tmp_path))
+
+    monkeypatch.setattr(reader, "_TABLE_CACHE", TableCache(max_bytes=0))
+    uncached = reader.table_schema(f"file:{csv_path}", 2000)
+    monkeypatch.setattr(reader, "_TABLE_CACHE", TableCache(max_bytes=1 << 20))
+    cached = reader.table_schema(f"file:{csv_path}", 2000)
+
+    plain = pd.read_csv(csv_path)
+    assert [c["type"] for c in uncached["columns"]] == [
+        reader._map_dtype(plain[name]) for name in plain.columns
+    ]
+    assert cached["columns"] == uncached["columns"]
+    assert cached["columns"][0]["type"] == "character"
+
+
+def test_disabled_cache_returns_loader_frame_unchanged(tmp_path):
+    csv_path = tmp_path / "demo.csv"
+    _write_csv(csv_path, 20)
+    cache = TableCache(max_bytes=0)
+
+    df = cache.get_or_load(str(csv_path), pd.read_csv)
+    assert df["id"].dtype == "int64"
+    assert not isinstance(df["label"].dtype, pd.CategoricalDtype)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["entries"] == 0